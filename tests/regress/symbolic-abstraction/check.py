@@ -1,34 +1,45 @@
 #!/usr/bin/python
 
 import sys
-from termcolor import colored, cprint
+from termcolor import colored
 
-warning = colored('Warning:', 'red', attrs=['bold'])
+def escapes(color=None, attrs=None):
+    """Returns the (prefix, suffix) termcolor wraps around text"""
+    return tuple(colored('\0', color, attrs=attrs).split('\0'))
+
+BOLD_ON, BOLD_OFF = escapes(attrs=['bold'])
+RED_ON, RED_OFF = escapes('red')
+GREEN_ON, GREEN_OFF = escapes('green')
+YELLOW_ON, YELLOW_OFF = escapes('yellow')
+
+warning = colored('Warning:', 'red', attrs=['bold']) + '\n'
+write = sys.stdout.write
+
+target = sys.argv[2] if len(sys.argv) > 2 else None
 
 with open(sys.argv[1]) as result:
-    #Read everything into one list
-    lines = result.readlines()
-    #Remove newline characters
-    lines = [elem.strip('\n') for elem in lines]
-
-    for line  in lines:
-       keyvalue = line.split(" -> ")
-       bval = colored (keyvalue[0], attrs=['bold'])
-
-       if keyvalue[1] == "bottom":
-           print(warning)
-           print(bval + " may be mapped to bottom")
+    # Stream the file, stopping as soon as the requested value is found
+    for line in result:
+       key, _, value = line.rstrip('\n').partition(" -> ")
+
+       if value == "bottom":
+           write(warning)
+           write(BOLD_ON + key + BOLD_OFF + " may be mapped to bottom\n")
            continue
-       if len(sys.argv) > 2:
-           if keyvalue[0] == sys.argv[2]:
-               if keyvalue[1] == "top":
-                   cprint (keyvalue[0] + " is mapped to top. This is sound but maybe unintended", 'yellow')
-                   sys.exit(0)
-               else:
-                   if keyvalue[1] == sys.argv[3]:
-                       cprint ("Success", 'green')
-                       sys.exit(0)
-                   else:
-                       cprint ("Fail! Wrong value for "+keyvalue[0], 'red')
-                       cprint ("Value was "+keyvalue[1] + " but should be "+ sys.argv[3])
-                       sys.exit(0)
+       if key == target:
+           break
+    else:
+       # the requested variable was not found (or none was requested)
+       sys.exit(0)
+
+# Exit codes: 0 on success, 1 for a wrong value, 2 for an unintended top
+if value == "top":
+    write(YELLOW_ON + target + " is mapped to top. This is sound but maybe unintended" + YELLOW_OFF + '\n')
+    sys.exit(2)
+elif value == sys.argv[3]:
+    write(GREEN_ON + "Success" + GREEN_OFF + '\n')
+    sys.exit(0)
+else:
+    write(RED_ON + "Fail! Wrong value for " + target + RED_OFF + '\n')
+    write("Value was " + value + " but should be " + sys.argv[3] + '\n')
+    sys.exit(1)
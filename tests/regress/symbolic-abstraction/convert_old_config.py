@@ -1,47 +1,51 @@
-#!/usr/bin/env python2
+#!/usr/bin/env python3
 
 import sys
 import yaml
-import re
 
-config_re = re.compile("^(.*CONFIG:)(.*)$")
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
+
+CONFIG_TAG = 'CONFIG:'
 
 def main(file_name):
     lines_pre = []
     lines_post = []
-    yaml_src = ''
+    yaml_parts = []
     prefix = None
+    skip = len(CONFIG_TAG)
 
     with open(file_name) as fp:
         for line in fp:
-            m = config_re.match(line)
-            if m is None:
+            # the last tag on the line delimits the prefix
+            i = line.rfind(CONFIG_TAG)
+            if i < 0:
                 if prefix is None:
                     lines_pre.append(line)
                 else:
                     lines_post.append(line)
             else:
-                yaml_src += '\n' + m.group(2)
-                prefix = m.group(1)
-
+                yaml_parts.append(line[i + skip:].rstrip('\n'))
+                prefix = line[:i + skip]
 
-    yaml_dict = yaml.load(yaml_src)
+    yaml_src = ''.join('\n' + x for x in yaml_parts)
+    yaml_dict = yaml.load(yaml_src, Loader=Loader)
 
-    with open(file_name, 'w') as out:
-        for x in lines_pre:
-            out.write(x)
+    domains = yaml_dict['AbstractDomain']
+    del yaml_dict['AbstractDomain']
 
-        domains = yaml_dict['AbstractDomain']
-        del yaml_dict['AbstractDomain']
+    out_parts = list(lines_pre)
+    for k, v in yaml_dict.items():
+        out_parts.append(f'{prefix} config.{k} = {v}\n')
 
-        for k, v in yaml_dict.items():
-            out.write('%s config.%s = %s\n' % (prefix, k, v))
+    domlist = ', '.join(f"globals()['{x}']" for x in domains)
+    out_parts.append(f'{prefix} config.AbstractDomain = [{domlist}]\n')
+    out_parts.extend(lines_post)
 
-        domlist = ', '.join('globals()[\'%s\']' % x for x in domains)
-        out.write('%s config.AbstractDomain = [%s]\n' % (prefix, domlist))
-
-        for x in lines_post:
-            out.write(x)
+    with open(file_name, 'w') as out:
+        out.write(''.join(out_parts))
 
 
 if __name__ == '__main__':
@@ -1,27 +1,39 @@
+import array
 import struct
 import string
 
+_DOUBLE = struct.Struct('!d')
+
+
+def bits_to_smt(as_ull):
+    """Converts the bit pattern of an IEEE double to an smt-lib notation"""
+
+    return (f'(fp #b{as_ull >> 63} #b{(as_ull >> 52) & 0x7FF:011b}'
+            f' #x{as_ull & 0xFFFFFFFFFFFFF:013x})')
+
 
 def double_to_smt(x):
     """Converts a IEEE double to an smt-lib notation compatible with Z3"""
 
-    as_ull = struct.unpack('!Q', struct.pack('!d', x))[0]
-    bits = format(as_ull, '064b')
-    exponent = bits[1:12]
-    significand = bits[12:]
+    return bits_to_smt(int.from_bytes(_DOUBLE.pack(x), 'big'))
+
 
-    # convert significand to a hex notation
-    significand = format(int(significand, 2), '013x')
+def doubles_to_bits(xs):
+    """Reinterprets a sequence of doubles as 64-bit integers in one pass"""
 
-    return '(fp #b' + bits[0] + ' #b' + exponent + ' #x' + significand + ')'
+    # both views share the native byte order, so no swapping is needed to
+    # get the same integers as struct's '!d'/'!Q' round trip
+    return memoryview(array.array('d', xs)).cast('B').cast('Q').tolist()
 
 
 def gen_literal_test():
     nums = ['1.0', '-1.0', '2.0', '-2.0', '+0.0', '-0.0', '+inf', '-inf',
             '4.9406564584124654e-324', '-4.9406564584124654e-324']
 
-    for (var, num) in zip(string.ascii_letters, nums):
-        print('; RUN: grep \'%s -> %s\' %%t2' % (var, double_to_smt(float(num))))
+    smts = [bits_to_smt(as_ull)
+            for as_ull in doubles_to_bits(float(num) for num in nums)]
+    for (var, smt) in zip(string.ascii_letters, smts):
+        print('; RUN: grep \'%s -> %s\' %%t2' % (var, smt))
 
     for (var, num) in zip(string.ascii_letters, nums):
         print('%%%s = fadd double 0.0, %s' % (var, num))
@@ -3,13 +3,14 @@
 import sys
 import re
 
-config_re = re.compile("(CONFIG:)(.*\n)")
+config_re = re.compile("CONFIG:(.*)")
 
 def main(fin):
-    for line in fin:
-        assert line.endswith('\n')
-        for _, config_line in config_re.findall(line):
-            sys.stdout.write(config_line.strip() + '\n')
+    write = sys.stdout.write
+    # '.' stops at newlines, so one pass over the whole buffer finds the
+    # first tag on each line just like a line-by-line scan would
+    for m in config_re.finditer(fin.read()):
+        write(m.group(1).strip() + '\n')
 
 
 if __name__ == "__main__":